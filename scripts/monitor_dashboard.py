@@ -7,10 +7,16 @@ Main monitoring and dashboard system for trading infrastructure
 import os
 import sys
 import json
+import shutil
 import logging
 from datetime import datetime
 from pathlib import Path
 
+import psutil
+
+# Mount points checked for disk usage
+DISK_MOUNTS = ('/mnt/c', '/')
+
 class QAMonitor:
     """QA Monitor main class"""
     
@@ -84,9 +90,6 @@ class QAMonitor:
     
     def check_system_health(self) -> dict:
         """Check system health metrics"""
-        import psutil
-        import shutil
-        
         health = {
             'timestamp': datetime.now().isoformat(),
             'cpu_percent': psutil.cpu_percent(interval=1),
@@ -96,7 +99,7 @@ class QAMonitor:
         }
         
         # Check disk usage for main drives
-        for mount in ['/mnt/c', '/']:
+        for mount in DISK_MOUNTS:
             if os.path.exists(mount):
                 usage = shutil.disk_usage(mount)
                 health['disk_usage'][mount] = {
@@ -105,20 +108,30 @@ class QAMonitor:
                     'total_gb': usage.total / (1024**3)
                 }
         
-        # Check overall health
+        # Check overall health against the configured threshold names
+        metrics = {
+            'cpu_usage': health['cpu_percent'],
+            'memory_usage': health['memory_percent'],
+            'disk_usage': max(
+                (usage['used_percent'] for usage in health['disk_usage'].values()),
+                default=0.0
+            )
+        }
         for metric, threshold in self.config['alert_thresholds'].items():
-            if metric in health and health[metric] > threshold:
+            if metric in metrics and metrics[metric] > threshold:
                 health['status'] = 'warning'
         
         return health
     
-    def generate_report(self) -> str:
+    def generate_report(self, health: dict = None) -> str:
         """Generate monitoring report"""
-        health = self.check_system_health()
+        if health is None:
+            health = self.check_system_health()
+        generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         report_lines = [
             "# Spartan Labs QA Monitor Report",
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Generated: {generated}",
             "",
             "## System Health",
             f"Status: {health['status'].upper()}",
@@ -141,12 +154,12 @@ class QAMonitor:
         report_lines.extend([
             "## Trading Systems",
             "Status: Monitoring Active",
-            "Last Check: " + datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            f"Last Check: {generated}",
             "",
             "## Summary",
             "✅ Monitor: Active",
             f"✅ Config: Loaded from {self.config_path}",
-            f"✅ Reports: {len(list(self.reports_path.glob('*'))} reports available"
+            f"✅ Reports: {sum(1 for _ in self.reports_path.glob('*'))} reports available"
         ])
         
         return '\n'.join(report_lines)
@@ -174,8 +187,8 @@ class QAMonitor:
         if health['status'] == 'warning':
             self.logger.warning("System health threshold exceeded!")
         
-        # Generate and save report
-        report_content = self.generate_report()
+        # Generate and save report from the same health snapshot
+        report_content = self.generate_report(health)
         self.save_report(report_content)
         
         self.logger.info("Monitoring cycle completed")